@@ -1,11 +1,39 @@
 import tkinter as tk
 from tkinter import ttk
 import tkinter.messagebox as messagebox
-import csv
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+import functools
 import os
-os.chdir('C:\\Users\\nratt\\Documents\\PlatformIO\\Projects\\Python\\fertilizer_calculator') # Replace with the actual directory
+import re
+from pathlib import Path
 
+# Pflanzendaten liegen neben dem Skript; der Pfad wird einmalig aufgelöst
+DATA_FILE = Path(__file__).resolve().parent / 'pflanzendaten.csv'
+
+# Reine Info-Änderungen werden gesammelt und erst nach dieser Anzahl geschrieben
+INFO_FLUSH_INTERVALL = 5
+infos_dirty = False
+infos_ungespeichert = 0
+
+# Zahlenwert hinter dem Doppelpunkt im EC-Label, z.B. "EC-Wert (Erde): 1.20 uS/cm"
+_EC_RE = re.compile(r':\s*([\d.]+)')
+
+
+def _fast_ddmmyyyy(s):
+    """
+    Wandelt ein Datum im Format TT.MM.JJJJ in ein date-Objekt um.
+    Schneller als datetime.strptime, löst bei ungültigem Format ebenfalls ValueError aus.
+    """
+    d, m, y = s.split('.')
+    return date(int(y), int(m), int(d))
+
+@functools.lru_cache(maxsize=None)
+def _keimwoche(s):
+    """
+    Gibt die Kalenderwoche eines Keimdatums im Format TT.MM.JJJJ zurück.
+    Gleiche Datumsangaben werden nur einmal umgerechnet.
+    """
+    return _fast_ddmmyyyy(s).isocalendar()[1]
 
 def read_plant_data():
     """
@@ -18,67 +46,142 @@ def read_plant_data():
     """
     plant_data = {}
     try:
-        with open('pflanzendaten.csv', 'r', newline='', encoding='utf-8') as csvfile:
-            reader = csv.reader(csvfile)
-            next(reader)  # Überspringt die Kopfzeile
-            for row in reader:
-                plant_name, germination_date_str, genetics, info = row
-                try:
-                    # Datum in datetime Objekt umwandeln
-                    germination_date = datetime.strptime(germination_date_str, '%d.%m.%Y')
-                    # Keimwoche berechnen
-                    germination_week = germination_date.isocalendar().week
-                    plant_data[plant_name] = {
-                        "Keimwoche": germination_week,
-                        "Genetik": genetics,
-                        "Infos": info
-                    }
-                except ValueError:
-                    print(f"Ungültiges Datumsformat für {plant_name}: {germination_date_str}")
+        with open(DATA_FILE, 'r', newline='', encoding='utf-8', buffering=1 << 16) as csvfile:
+            data = csvfile.read()
+        # Nur an \n, \r\n und \r trennen wie csv.reader; splitlines() würde auch an
+        # Zeichen wie U+2028 trennen, die _q nicht in Anführungszeichen setzt
+        if '"' in data:
+            # Felder in Anführungszeichen (z.B. mehrzeilige Infos) brauchen den csv-Parser,
+            # der deshalb erst hier importiert wird
+            import csv
+            import io
+            rows = csv.reader(io.StringIO(data, newline=''))
+        else:
+            # Feste 4 Spalten; Kommas in den Infos bleiben im letzten Feld
+            if '\r' in data:
+                data = data.replace('\r\n', '\n').replace('\r', '\n')
+            rows = (line.split(',', 3) for line in data.split('\n'))
+        next(rows, None)  # Überspringt die Kopfzeile
+        for row in rows:
+            if not row or row == ['']:
+                continue  # Leerzeile
+            if len(row) != 4:
+                print(f"Zeile mit {len(row)} statt 4 Spalten wird übersprungen: {row}")
+                continue
+            plant_name, germination_date_str, genetics, info = row
+            try:
+                # Keimwoche aus dem Datum berechnen (zwischengespeichert je Datumsstring)
+                germination_week = _keimwoche(germination_date_str)
+                plant_data[plant_name] = {
+                    "Keimwoche": germination_week,
+                    "Keimdatum_str": germination_date_str,  # Originalwert für das Zurückschreiben
+                    "Genetik": genetics,
+                    "Infos": info
+                }
+            except ValueError:
+                print(f"Ungültiges Datumsformat für {plant_name}: {germination_date_str}")
     except FileNotFoundError:
         # Datei existiert nicht, also erstellen wir sie mit einer Kopfzeile
-        with open('pflanzendaten.csv', 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(["Pflanzenname", "Keimdatum", "Genetik", "Infos"])
-        print("Datei 'pflanzendaten.csv' wurde erstellt.")
+        with open(DATA_FILE, 'w', newline='', encoding='utf-8') as csvfile:
+            csvfile.write("Pflanzenname,Keimdatum,Genetik,Infos\n")
+        print(f"Datei '{DATA_FILE}' wurde erstellt.")
 
     return plant_data
 
+def _q(s):
+    """
+    Setzt einen CSV-Wert nur dann in Anführungszeichen, wenn er Komma,
+    Anführungszeichen oder Zeilenumbruch enthält.
+    """
+    if ',' in s or '"' in s or '\n' in s or '\r' in s:
+        return '"' + s.replace('"', '""') + '"'
+    return s
+
+def _write_plants(path, plant_data):
+    """
+    Schreibt alle Pflanzendaten mit einem einzigen Schreibaufruf in die CSV-Datei.
+    Geschrieben wird zuerst in eine temporäre Datei, die danach die alte Datei ersetzt,
+    damit ein Absturz beim Schreiben keine halbe CSV-Datei hinterlässt.
+    """
+    lines = ["Name,Keimungsdatum,Genetik,Infos\n"]
+    lines.extend(f'{_q(n)},{d["Keimdatum_str"]},{_q(d["Genetik"])},{_q(d["Infos"])}\n'
+                 for n, d in plant_data.items())
+    tmp = path.with_name(path.name + '.tmp')
+    with open(tmp, 'w', encoding='utf-8', newline='') as csvfile:
+        csvfile.writelines(lines)
+        csvfile.flush()
+        os.fsync(csvfile.fileno())
+    os.replace(tmp, path)
+
+@functools.lru_cache(maxsize=None)
+def _week_monday(year, week):
+    """
+    Gibt den Montag der angegebenen Woche (%W) im angegebenen Jahr zurück.
+    Das Ergebnis hängt nur von Jahr und Woche ab und wird daher zwischengespeichert.
+    """
+    return datetime.strptime(f'{year}-{week}-1', '%Y-%W-%w')
+
+def _set_readonly(entry, value):
+    """
+    Ersetzt den Inhalt eines schreibgeschützten Eingabefelds.
+    """
+    entry.config(state="normal")
+    entry.delete(0, tk.END)
+    entry.insert(0, value)
+    entry.config(state="readonly")
+
 def update_week(event=None):
     """
     Aktualisiert die aktuelle Woche basierend auf der 
     ausgewählten Pflanze und dem aktuellen Datum.
     """
-    try:
-        selected_plant = plant_var.get()
-        germination_week = plant_data[selected_plant]["Keimwoche"]
-        today = datetime.today()
-        year = today.year  # Aktuelles Jahr verwenden
-        # Datum des ersten Tages der Keimwoche berechnen
-        germination_date = datetime.strptime(f'{year}-{germination_week}-1', '%Y-%W-%w')
-        current_week = (today - germination_date).days // 7 + 1
-        week_entry.delete(0, tk.END)
-        week_entry.insert(0, str(current_week))
-        germination_date_entry.config(state="normal")  # Textfeld editierbar machen
-        germination_date_entry.delete(0, tk.END)
-        germination_date_entry.insert(0, str(germination_date.strftime('%d.%m.%Y')))        
-        germination_date_entry.config(state="readonly")  # Textfeld schreibgeschützt machen
-
-
-
-        # Genetik und Infos aktualisieren
-        genetics_entry.config(state="normal")  # Textfeld editierbar machen
-        genetics_entry.delete(0, tk.END)
-        genetics_entry.insert(0, plant_data[selected_plant]["Genetik"])
-        genetics_entry.config(state="readonly")  # Textfeld schreibgeschützt machen
-
-        info_text.delete("1.0", tk.END)
-        info_text.insert("1.0", plant_data[selected_plant]["Infos"])
-        calculate()
-        update_ec_value()
-
-    except KeyError:
-        pass  # Pflanze nicht gefunden, ignoriere den Fehler
+    selected_plant = plant_var.get()
+    info = plant_data.get(selected_plant)
+    if info is None:
+        return  # Pflanze nicht gefunden
+
+    today = date.today()
+    # Erster Tag der Keimwoche im aktuellen Jahr, als Tageszahl für reine Integer-Arithmetik
+    germ_ord = _week_monday(today.year, info["Keimwoche"]).toordinal()
+    current_week = (today.toordinal() - germ_ord) // 7 + 1
+    week_entry.delete(0, tk.END)
+    week_entry.insert(0, str(current_week))
+    _set_readonly(germination_date_entry, info["Keimdatum_str"])
+
+    # Genetik und Infos aktualisieren
+    _set_readonly(genetics_entry, info["Genetik"])
+
+    info_text.delete("1.0", tk.END)
+    info_text.insert("1.0", info["Infos"])
+    calculate()
+    update_ec_value()
+
+# Dosierungen pro Liter Wasser (ml/L) für Woche 1-10, eine Zeile pro Dünger.
+# Ab Woche 10 bleibt die Dosierung gleich (Plateau), daher werden spätere Wochen auf 10 begrenzt.
+FERT_PLATEAU_WEEK = 10
+FERT_TABLE = (
+    # CalMag - Substrate - Prevention
+    (0.3, 0.3, 0.3, 0.4, 0.4, 0.5, 0.6, 0.7, 0.8, 0.8),
+    # CalMag - Substrate - Correction
+    (0.5, 0.5, 0.5, 0.6, 0.6, 0.8, 0.8, 1.0, 1.1, 1.2),
+    # GreenHome Wachstumsduenger - Substrate
+    (2.0, 2.27, 2.54, 2.81, 3.08, 3.35, 3.62, 3.89, 4.16, 4.45),
+    # GreenHome Bluetenduenger - Substrate
+    (3, 3.33, 3.67, 4.0, 4.33, 4.67, 5.0, 5.33, 5.67, 6.0),
+    # Fish-Mix (5-1-4) - Substrate
+    (0, 2, 2, 2, 3, 3, 4, 4, 4, 4),
+    # Root-Juice
+    (4, 4, 4, 4, 4, 4, 4, 4, 4, 4),
+)
+# Zeilenindex in FERT_TABLE je Düngertyp (Reihenfolge wie in der GUI)
+FERT_INDEX = {name: i for i, name in enumerate([
+    "CalMag - Substrate - Prevention",
+    "CalMag - Substrate - Correction",
+    "GreenHome Wachstumsduenger - Substrate",
+    "GreenHome Bluetenduenger - Substrate",
+    "Fish-Mix (5-1-4) - Substrate",
+    "Root-Juice",
+])}
 
 def calculate_fertilizer_amount(week, water_amount, fertilizer_type):
     """
@@ -90,58 +193,17 @@ def calculate_fertilizer_amount(week, water_amount, fertilizer_type):
         fertilizer_type: Die Art des Düngers (str).
 
     Returns:
-        Die Düngemenge in Millilitern (float) oder 0 falls die Woche nicht gefunden wurde.
-    """
-
-    fertilizer_data = {
-        "CalMag - Substrate - Prevention": {
-            1: 0.3, 2: 0.3, 3: 0.3, 4: 0.4, 5: 0.4,
-            6: 0.5, 7: 0.6, 8: 0.7, 9: 0.8, 10: 0.8, 
-            11: 0.8, 12: 0.8, 13: 0.8, 14: 0.8, 15: 0.8,
-            16: 0.8, 17: 0.8, 18: 0.8, 19: 0.8, 20: 0.8
-        },
-        "CalMag - Substrate - Correction": {
-            1: 0.5, 2: 0.5, 3: 0.5, 4: 0.6, 5: 0.6,
-            6: 0.8, 7: 0.8, 8: 1.0, 9: 1.1, 10: 1.2, 
-            11: 1.2, 12: 1.2, 13: 1.2, 14: 1.2, 15: 1.2,
-            16: 1.2, 17: 1.2, 18: 1.2, 19: 1.2, 20: 1.2
-        },
-        "GreenHome Wachstumsduenger - Substrate":{
-            1: 2.0, 2: 2.27, 3: 2.54, 4: 2.81, 5: 3.08,
-            6: 3.35, 7: 3.62, 8: 3.89, 9: 4.16, 10: 4.45, 
-            11: 4.45, 12: 4.45, 13: 4.45, 14: 4.45, 15: 4.45,
-            16: 4.45, 17: 4.45, 18: 4.45, 19: 4.45, 20: 4.45
-        },
-        "GreenHome Bluetenduenger - Substrate":{
-            1: 3, 2: 3.33, 3: 3.67, 4: 4.0, 5: 4.33,
-            6: 4.67, 7: 5.0, 8: 5.33, 9: 5.67, 10: 6.0, 
-            11: 6.0, 12: 6.0, 13: 6.0, 14: 6.0, 15: 6.0,
-            16: 6.0, 17: 6.0, 18: 6.0, 19: 6.0, 20: 6.0
-        },
-        "Fish-Mix (5-1-4) - Substrate": {
-            1: 0, 2: 2, 3: 2, 4: 2, 5: 3,
-            6: 3, 7: 4, 8: 4, 9: 4, 10: 4, 
-            11: 4, 12: 4, 12: 4, 13: 4, 14: 4,
-            15: 4, 16: 4, 17: 4, 18: 4, 19: 4, 20: 4
-        },
-        "Root-Juice": {
-            1: 4, 2: 4, 3: 4, 4: 4, 5: 4,
-            6: 4, 7: 4, 8: 4, 9: 4, 10: 4, 
-            11: 4, 12: 4, 13: 4, 14: 4, 15: 4,
-            16: 4, 17: 4, 18: 4, 19: 4, 20: 4
-        }
-    }
-
-    if fertilizer_type not in fertilizer_data:
+        Die Düngemenge in Millilitern (float); 0 für Wochen unter 1.
+        Wochen nach dem Plateau zählen als FERT_PLATEAU_WEEK.
+    """
+    i = FERT_INDEX.get(fertilizer_type)
+    if i is None:
         return "Ungültiger Düngertyp."
 
-    if week not in fertilizer_data[fertilizer_type]:
+    if week < 1:
         return 0
-
-    dosage_per_liter = fertilizer_data[fertilizer_type][week]
-    fertilizer_amount = dosage_per_liter * water_amount
-
-    return fertilizer_amount
+    idx = min(week, FERT_PLATEAU_WEEK) - 1
+    return FERT_TABLE[i][idx] * water_amount
 
 def calculate(fertilizer_type=None, var=None):
     """
@@ -160,34 +222,58 @@ def calculate(fertilizer_type=None, var=None):
                 result_label = result_labels[fertilizer_options.index(fertilizer_type)]
                 result_label.config(text="")
         else:
-            for checkbox, var, result_label in zip(checkboxes, fertilizer_vars, result_labels):
-                if var.get() == 1:
-                    fertilizer_type = checkbox.cget("text")
-                    result = calculate_fertilizer_amount(week, water_amount, fertilizer_type)
-                    result_label.config(text=f"{result:.2f} ml")
-                else:
-                    result_label.config(text="")
+            # Alle Dünger der Woche in einem Durchgang berechnen (Zeilen wie fertilizer_options)
+            if week < 1:
+                results = [0] * len(FERT_TABLE)  # Vor Woche 1 wird nicht gedüngt
+            else:
+                idx = min(week, FERT_PLATEAU_WEEK) - 1
+                results = [row[idx] * water_amount for row in FERT_TABLE]
+            for var, result_label, result in zip(fertilizer_vars, result_labels, results):
+                result_label.config(text=f"{result:.2f} ml" if var.get() == 1 else "")
     except ValueError:
         result_label.config(text="Ungültige Eingabe.")
 
 def save_info():
     """
-    Speichert die Infos in der CSV-Datei.
+    Übernimmt die Infos der ausgewählten Pflanze.
+    Da sich nur die Infos ändern, wird die CSV-Datei erst nach
+    INFO_FLUSH_INTERVALL Änderungen oder beim Schließen des Fensters geschrieben.
     """
+    global infos_dirty, infos_ungespeichert
     selected_plant = plant_var.get()
     new_info = info_text.get("1.0", tk.END).strip()
+    if plant_data[selected_plant]["Infos"] == new_info:
+        return  # Nichts geändert
     plant_data[selected_plant]["Infos"] = new_info
+    infos_dirty = True
+    infos_ungespeichert += 1
+    if infos_ungespeichert >= INFO_FLUSH_INTERVALL:
+        infos_schreiben()
+
+def _persist_plants():
+    """
+    Schreibt alle Pflanzendaten in die CSV-Datei.
+    Ausstehende Info-Änderungen sind danach mitgeschrieben.
+    """
+    global infos_dirty, infos_ungespeichert
+    _write_plants(DATA_FILE, plant_data)
+    infos_dirty = False
+    infos_ungespeichert = 0
+
+def infos_schreiben():
+    """
+    Schreibt ausstehende Info-Änderungen in die CSV-Datei.
+    """
+    if infos_dirty:
+        _persist_plants()
+
+def fenster_schliessen():
+    """
+    Schreibt ausstehende Änderungen und schließt das Hauptfenster.
+    """
+    infos_schreiben()
+    window.destroy()
 
-    # CSV-Datei aktualisieren
-    with open('pflanzendaten.csv', 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(["Name", "Keimungsdatum", "Genetik", "Infos"])  # Kopfzeile schreiben
-        for plant_name, data in plant_data.items():
-            writer.writerow([plant_name, 
-                             datetime.strptime(f'{datetime.now().year}-{data["Keimwoche"]}-1', '%Y-%W-%w').strftime('%d.%m.%Y'), 
-                             data["Genetik"], 
-                             data["Infos"]])
-            
 def neue_pflanze_hinzufuegen():
     """
     Öffnet ein neues Fenster, um Daten für eine neue Pflanze einzugeben.
@@ -212,24 +298,20 @@ def neue_pflanze_hinzufuegen():
             keimwoche = keimdatum_objekt.isocalendar().week
 
             # Pflanze zu plant_data hinzufügen
+            if neuer_pflanzenname not in plant_data:
+                plant_names.append(neuer_pflanzenname)
             plant_data[neuer_pflanzenname] = {
                 "Keimwoche": keimwoche,
+                "Keimdatum_str": neues_keimdatum,
                 "Genetik": neue_genetik,
                 "Infos": neue_infos
             }
 
             # CSV-Datei aktualisieren
-            with open('pflanzendaten.csv', 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(["Name", "Keimungsdatum", "Genetik", "Infos"])  # Kopfzeile schreiben
-                for pflanzenname, daten in plant_data.items():
-                    writer.writerow([pflanzenname,
-                                     datetime.strptime(f'{datetime.now().year}-{daten["Keimwoche"]}-1', '%Y-%W-%w').strftime('%d.%m.%Y'),
-                                     daten["Genetik"],
-                                     daten["Infos"]])
+            _persist_plants()
 
             # Hauptfenster aktualisieren
-            plant_dropdown['values'] = list(plant_data.keys())
+            plant_dropdown['values'] = tuple(plant_names)
             plant_var.set(neuer_pflanzenname)
             update_week()
 
@@ -284,25 +366,26 @@ def pflanze_loeschen():
 
     if selected_plant in plant_data:
         del plant_data[selected_plant]
+        plant_names.remove(selected_plant)
 
         # CSV-Datei aktualisieren
-        with open('pflanzendaten.csv', 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(["Name", "Keimungsdatum", "Genetik", "Infos"])  # Kopfzeile schreiben
-            for plant_name, data in plant_data.items():
-                writer.writerow([plant_name,
-                                 datetime.strptime(f'{datetime.now().year}-{data["Keimwoche"]}-1', '%Y-%W-%w').strftime('%d.%m.%Y'),
-                                 data["Genetik"],
-                                 data["Infos"]])
+        _persist_plants()
 
         # Hauptfenster aktualisieren
-        plant_dropdown['values'] = list(plant_data.keys())
-        if plant_data:
-            plant_var.set(list(plant_data.keys())[0])
+        plant_dropdown['values'] = tuple(plant_names)
+        if plant_names:
+            plant_var.set(plant_names[0])
         else:
             plant_var.set("")
         update_week()
 
+# EC-Werte für Erde je Woche seit Keimung (Woche 1-18).
+# Ab Woche 18 bleibt der Wert gleich (Plateau), spätere Wochen werden darauf begrenzt.
+_EC_VALUES = (
+    0.4, 0.6, 0.7, 0.9, 1.0, 1.2, 1.4, 1.5, 1.6, 1.6,
+    1.7, 1.7, 1.8, 1.8, 1.9, 1.9, 1.9, 2.0
+)
+
 def get_ec_value(week):
     """
     Gibt den EC-Wert für die entsprechende Woche zurück.
@@ -311,32 +394,12 @@ def get_ec_value(week):
         week: Die aktuelle Woche seit Keimung (int).
 
     Returns:
-        Den EC-Wert für Erde (float) oder None, falls die Woche nicht gefunden wurde.
-    """
-    ec_values = {
-        1: 0.4,
-        2: 0.6,
-        3: 0.7,
-        4: 0.9,
-        5: 1.0,
-        6: 1.2,
-        7: 1.4,
-        8: 1.5,
-        9: 1.6,
-        10: 1.6,
-        11: 1.7,
-        12: 1.7,
-        13: 1.8,
-        14: 1.8,
-        14: 1.8,
-        15: 1.9,
-        16: 1.9,
-        17: 1.9,
-        18: 2.0,
-        19: 2.0,
-        20: 2.0
-    }
-    return ec_values.get(week)
+        Den EC-Wert für Erde (float) oder None für Wochen unter 1.
+        Wochen nach dem Plateau zählen als letzte definierte Woche.
+    """
+    if week < 1:
+        return None
+    return _EC_VALUES[min(week, len(_EC_VALUES)) - 1]
 
 def update_ec_value():
     """
@@ -344,8 +407,9 @@ def update_ec_value():
     """
     try:
         week = int(week_entry.get())
-        ec_value = get_ec_value(week) * 1000  # Umrechnung in uS/cm
+        ec_value = get_ec_value(week)
         if ec_value is not None:
+            ec_value *= 1000  # Umrechnung in uS/cm
             ec_label.config(text=f"EC-Wert (Erde): {ec_value:.2f} uS/cm")
         else:
             ec_label.config(text="EC-Wert (Erde): -")
@@ -401,8 +465,10 @@ def ec_berechnen():
 
             # EC-Sollwert basierend auf der Auswahl im Dropdown-Menü ermitteln
             if ec_soll_var.get() == "vorhanden":
-                EC_soll_text = ec_label.cget("text")
-                EC_soll = float(EC_soll_text.split(":")[1].strip().split()[0])
+                m = _EC_RE.search(ec_label.cget("text"))
+                if m is None:
+                    raise ValueError("Kein Soll-EC im Label")
+                EC_soll = float(m.group(1))
             else:
                 EC_soll = float(ec_soll_entry.get())
 
@@ -502,13 +568,14 @@ window.title("Düngerberechnung")
 
 # Pflanzendaten einlesen
 plant_data = read_plant_data()
+plant_names = list(plant_data)  # Reihenfolge der Pflanzen im Dropdown, wird mit plant_data gepflegt
 
 # Dropdown-Menü für Pflanzenauswahl
 plant_label = tk.Label(window, text="Pflanze:")
 plant_label.grid(row=0, column=0)
 plant_var = tk.StringVar()
 plant_dropdown = ttk.Combobox(window, textvariable=plant_var)
-plant_dropdown['values'] = list(plant_data.keys())
+plant_dropdown['values'] = tuple(plant_names)
 plant_dropdown.grid(row=0, column=1)
 plant_dropdown.bind("<<ComboboxSelected>>", update_week)
 
@@ -547,7 +614,7 @@ water_amount_entry.bind("<Return>", lambda event: calculate())  # calculate() be
 # Checkboxen für Düngertypen
 # fertilizer_label = tk.Label(window, text="Düngertypen:")
 # fertilizer_label.grid(row=4, column=0)
-fertilizer_options = ["CalMag - Substrate - Prevention", "CalMag - Substrate - Correction", "GreenHome Wachstumsduenger - Substrate", "GreenHome Bluetenduenger - Substrate", "Fish-Mix (5-1-4) - Substrate", "Root-Juice"]
+fertilizer_options = list(FERT_INDEX)
 
 fertilizer_vars = []
 checkboxes = []
@@ -563,7 +630,7 @@ result_labels = []  # Liste für die Ergebnis-Labels
 for i, option in enumerate(fertilizer_options):
     var = tk.IntVar()
     fertilizer_vars.append(var)
-    checkbox = tk.Checkbutton(window, text=option, variable=var, command=lambda option=option, var=var: calculate(option, var))
+    checkbox = tk.Checkbutton(window, text=option, variable=var, command=functools.partial(calculate, option, var))
     checkbox.grid(row=i+5, column=0, sticky="w")
     checkboxes.append(checkbox)
 
@@ -591,6 +658,8 @@ neue_pflanze_button.grid(row=14, column=1)
 loeschen_button = tk.Button(window, text="Pflanze löschen", command=pflanze_loeschen)
 loeschen_button.grid(row=14, column=2)
 
+# Ausstehende Info-Änderungen beim Schließen schreiben
+window.protocol("WM_DELETE_WINDOW", fenster_schliessen)
 
 
 window.mainloop()
\ No newline at end of file
@@ -2,109 +2,202 @@ import tkinter as tk
 from tkinter import ttk  # Import themed widgets
 import tkinter.messagebox as messagebox
 import tkinter.scrolledtext as scrolledtext # For scrolled text area
-import csv
-from datetime import datetime, timedelta
+import atexit
+import concurrent.futures
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime, time, timedelta
 import os
-from typing import Dict, Any, Optional # For type hinting
+import queue
+import re
+import sys
+import threading
+from typing import Dict, List, Optional, Tuple # For type hinting
 
 # --- Konstanten ---
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 CSV_FILENAME = os.path.join(SCRIPT_DIR, 'pflanzendaten.csv')
+CSV_FILENAME_B = os.fsencode(CSV_FILENAME) # Einmal kodierter Pfad für open()
 CSV_HEADER = ["Pflanzenname", "Keimdatum", "Genetik", "Infos"]
+_NCOLS = len(CSV_HEADER) # Erwartete Spaltenanzahl je Datenzeile
+DATE_FORMAT = '%d.%m.%Y' # Format des Keimdatums (TT.MM.JJJJ)
+_DATE_RE = re.compile(r'(\d{1,2})\.(\d{1,2})\.(\d{4})') # Vorprüfung von DATE_FORMAT ohne Ausnahmen
 EC_FACTOR_WACHSTUM = 478 # EC increase in µS/cm per ml/L for Wachstumsdünger
 EC_FACTOR_BLUETE = 430   # EC increase in µS/cm per ml/L for Blütendünger
+CALC_DEBOUNCE_MS = 30    # Wartezeit, in der mehrere Neuberechnungs-Auslöser zusammengefasst werden
+WARNUNGEN_DIALOG_AB = 3  # Ab mehr als so vielen Einlese-Warnungen zusätzlich einen Dialog zeigen
+PLANT_LOAD_POLL_MS = 50  # Abfrageintervall, bis die Pflanzendaten im Hintergrund geladen sind
+SPEICHER_INTERVALL = 16  # Nach so vielen Änderungen wird die CSV-Datei spätestens geschrieben
+SPEICHER_VERZOEGERUNG_MS = 2000 # Spätestens so lange nach der ersten ungespeicherten Änderung wird geschrieben
 
 # --- Datenmanagement ---
 
-def read_plant_data() -> Dict[str, Dict[str, Any]]:
+@dataclass(slots=True)
+class PlantRecord:
+    """Ein Eintrag der Pflanzendaten (eine Zeile der CSV-Datei ohne den Namen)."""
+    Keimdatum: datetime
+    Genetik: str
+    Infos: str
+    germ_ord: int = field(init=False, repr=False, compare=False) # Keimdatum als Tageszahl (toordinal)
+
+    def __post_init__(self):
+        self.germ_ord = self.Keimdatum.toordinal()
+
+def _parse_ddmmyyyy(s: str) -> Optional[datetime]:
+    """
+    Wandelt ein Datum im Format TT.MM.JJJJ ohne strptime in ein datetime-Objekt um.
+    Gibt None zurück, wenn das Format nicht passt; ein unmögliches Datum (z.B. 31.02.)
+    löst weiterhin ValueError aus.
+    """
+    m = _DATE_RE.fullmatch(s)
+    if m is None:
+        return None
+    d, mo, y = m.groups()
+    return datetime(int(y), int(mo), int(d))
+
+def _format_ddmmyyyy(d: datetime) -> str:
+    """Formatiert ein Datum als TT.MM.JJJJ (entspricht DATE_FORMAT) ohne strftime."""
+    return f"{d.day:02d}.{d.month:02d}.{d.year:04d}"
+
+def _melden(dialoge: Optional[List[Tuple[str, str, str]]], art: str, titel: str, text: str) -> None:
+    """
+    Zeigt einen messagebox-Dialog (art z.B. "showerror") an oder sammelt ihn in
+    dialoge, wenn außerhalb des GUI-Threads gearbeitet wird.
+    """
+    if dialoge is None:
+        getattr(messagebox, art)(titel, text)
+    else:
+        dialoge.append((art, titel, text))
+
+def read_plant_data(dialoge: Optional[List[Tuple[str, str, str]]] = None) -> Dict[str, PlantRecord]:
     """
     Liest die Pflanzendaten aus der CSV-Datei ein.
     Erstellt die Datei mit Kopfzeile, falls sie nicht existiert.
 
+    Args:
+        dialoge: Falls angegeben, werden Fehlermeldungen als (Art, Titel, Text)
+            gesammelt statt direkt angezeigt (für den Aufruf außerhalb des GUI-Threads).
+
     Returns:
-        Ein Dictionary mit Pflanzennamen als Schlüssel und einem Dictionary
-        mit "Keimdatum" (datetime object), "Genetik" und "Infos" als Werte.
+        Ein Dictionary mit Pflanzennamen als Schlüssel und PlantRecord-Einträgen als Werte.
     """
-    plant_data: Dict[str, Dict[str, Any]] = {}
+    plant_data: Dict[str, PlantRecord] = {}
+    warnungen: List[str] = [] # Werden gesammelt und nach dem Einlesen einmalig ausgegeben
     try:
-        with open(CSV_FILENAME, 'r', newline='', encoding='utf-8') as csvfile:
-            reader = csv.reader(csvfile)
-            try:
-                header = next(reader)
-                if header != CSV_HEADER:
-                    print(f"Warnung: Unerwartete Kopfzeile in {CSV_FILENAME}: {header}")
-                    # Optional: Fehler auslösen oder Standard annehmen
-            except StopIteration:
-                # Datei ist leer, sollte aber nicht passieren, wenn sie erstellt wurde
-                print(f"Warnung: CSV-Datei '{CSV_FILENAME}' ist leer oder enthält keine Kopfzeile.")
-                # Header neu schreiben?
-                # with open(CSV_FILENAME, 'w', newline='', encoding='utf-8') as outfile:
-                #    writer = csv.writer(outfile)
-                #    writer.writerow(CSV_HEADER)
-                return plant_data # Leeres Dictionary zurückgeben
-
-            for i, row in enumerate(reader, start=2): # start=2 wegen Kopfzeile
-                if len(row) == len(CSV_HEADER):
-                    plant_name, germination_date_str, genetics, info = row
-                    try:
-                        # Datum in datetime Objekt umwandeln
-                        germination_date = datetime.strptime(germination_date_str, '%d.%m.%Y')
-                        if plant_name in plant_data:
-                             print(f"Warnung: Doppelter Pflanzenname '{plant_name}' in Zeile {i}. Überspringe.")
-                             continue
-                        plant_data[plant_name] = {
-                            "Keimdatum": germination_date,
-                            "Genetik": genetics,
-                            "Infos": info
-                        }
-                    except ValueError:
-                        print(f"Warnung: Ungültiges Datumsformat '{germination_date_str}' für Pflanze '{plant_name}' in Zeile {i}. Überspringe Eintrag.")
-                    except Exception as e:
-                        print(f"Fehler beim Verarbeiten der Zeile {i} für '{plant_name}': {row} - {e}. Überspringe Eintrag.")
-                else:
-                    print(f"Warnung: Zeile {i} hat unerwartete Spaltenanzahl ({len(row)} statt {len(CSV_HEADER)}). Überspringe: {row}")
+        # Datei in einem Stück einlesen und im Speicher zerlegen
+        with open(CSV_FILENAME_B, 'rb') as csvfile:
+            data = csvfile.read().decode('utf-8')
+        if not data:
+            print(f"Warnung: CSV-Datei '{CSV_FILENAME}' ist leer oder enthält keine Kopfzeile.")
+            return plant_data # Leeres Dictionary zurückgeben
+
+        # Zeilen nur an \n, \r\n und \r trennen wie csv.reader mit newline=''; splitlines()
+        # würde auch an Zeichen wie U+2028 trennen, die _csv_field nicht in Anführungszeichen setzt
+        if '"' in data:
+            # Felder mit Anführungszeichen (z.B. mehrzeilige Infos) braucht den csv-Parser;
+            # das Modul wird erst hier geladen, da der schnelle Pfad es nicht braucht
+            import csv
+            import io
+            rows = list(csv.reader(io.StringIO(data, newline='')))
+        else:
+            # Schneller Pfad: feste 4 Spalten, Infos dürfen weitere Kommas enthalten
+            if '\r' in data:
+                data = data.replace('\r\n', '\n').replace('\r', '\n')
+            lines = data.split('\n')
+            if lines[-1] == '':
+                lines.pop() # Zeilenende der letzten Zeile
+            rows = [line.split(',', 3) for line in lines]
+
+        header = rows[0]
+        if header != CSV_HEADER:
+            warnungen.append(f"Warnung: Unerwartete Kopfzeile in {CSV_FILENAME}: {header}")
+            # Optional: Fehler auslösen oder Standard annehmen
+
+        parse_date = _parse_ddmmyyyy # Lokal gebunden für die Schleife
+        date_cache: Dict[str, datetime] = {} # Mehrfach vorkommende Keimdaten nur einmal parsen
+        for i, row in enumerate(rows[1:], start=2): # start=2 wegen Kopfzeile
+            if len(row) == _NCOLS:
+                plant_name, germination_date_str, genetics, info = row
+                try:
+                    # Datum in datetime Objekt umwandeln
+                    germination_date = date_cache.get(germination_date_str)
+                    if germination_date is None:
+                        germination_date = parse_date(germination_date_str)
+                        if germination_date is None:
+                            warnungen.append(f"Warnung: Ungültiges Datumsformat '{germination_date_str}' für Pflanze '{plant_name}' in Zeile {i}. Überspringe Eintrag.")
+                            continue
+                        date_cache[germination_date_str] = germination_date
+                    # setdefault fügt ein und erkennt Duplikate mit nur einem Hash-Zugriff
+                    record = PlantRecord(germination_date, genetics, info)
+                    if plant_data.setdefault(plant_name, record) is not record:
+                         warnungen.append(f"Warnung: Doppelter Pflanzenname '{plant_name}' in Zeile {i}. Überspringe.")
+                         continue
+                except ValueError:
+                    warnungen.append(f"Warnung: Ungültiges Datumsformat '{germination_date_str}' für Pflanze '{plant_name}' in Zeile {i}. Überspringe Eintrag.")
+                except Exception as e:
+                    warnungen.append(f"Fehler beim Verarbeiten der Zeile {i} für '{plant_name}': {row} - {e}. Überspringe Eintrag.")
+            else:
+                warnungen.append(f"Warnung: Zeile {i} hat unerwartete Spaltenanzahl ({len(row)} statt {_NCOLS}). Überspringe: {row}")
 
     except FileNotFoundError:
         print(f"Datei '{CSV_FILENAME}' nicht gefunden. Erstelle neue Datei.")
         try:
-            with open(CSV_FILENAME, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(CSV_HEADER)
+            with open(CSV_FILENAME_B, 'w', newline='', encoding='utf-8') as csvfile:
+                csvfile.write(",".join(CSV_HEADER) + "\n")
             print(f"Datei '{CSV_FILENAME}' wurde erfolgreich erstellt.")
         except IOError as e:
-            messagebox.showerror("Fehler beim Erstellen der Datei", f"Konnte CSV-Datei nicht erstellen:\n{e}")
+            _melden(dialoge, "showerror", "Fehler beim Erstellen der Datei", f"Konnte CSV-Datei nicht erstellen:\n{e}")
     except IOError as e:
-        messagebox.showerror("Fehler beim Lesen", f"Konnte CSV-Datei nicht lesen:\n{e}")
+        _melden(dialoge, "showerror", "Fehler beim Lesen", f"Konnte CSV-Datei nicht lesen:\n{e}")
     except Exception as e:
-         messagebox.showerror("Unerwarteter Fehler", f"Ein Fehler ist beim Lesen der Pflanzendaten aufgetreten:\n{e}")
+         _melden(dialoge, "showerror", "Unerwarteter Fehler", f"Ein Fehler ist beim Lesen der Pflanzendaten aufgetreten:\n{e}")
+
+    if warnungen:
+        print("\n".join(warnungen))
+        if len(warnungen) > WARNUNGEN_DIALOG_AB:
+            _melden(dialoge, "showwarning", "Datenprobleme", f"{len(warnungen)} Warnungen beim Einlesen der Pflanzendaten.\nErste: {warnungen[0]}")
 
     return plant_data
 
-def save_plant_data_to_csv(data_to_save: Dict[str, Dict[str, Any]]):
+def _csv_field(value: str) -> str:
+    """Setzt einen CSV-Wert nur bei Bedarf (Komma, Anführungszeichen, Zeilenumbruch) in Anführungszeichen."""
+    if ',' in value or '"' in value or '\n' in value or '\r' in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+def save_plant_data_to_csv(data_to_save: Dict[str, PlantRecord],
+                           dialoge: Optional[List[Tuple[str, str, str]]] = None):
     """
     Speichert das übergebene Pflanzendaten-Dictionary in die CSV-Datei.
-    Überschreibt die vorhandene Datei.
+    Überschreibt die vorhandene Datei mit einem einzigen Schreibaufruf.
+
+    Args:
+        data_to_save: Die zu speichernden Pflanzendaten.
+        dialoge: Wie bei read_plant_data; sammelt Fehlermeldungen statt sie anzuzeigen.
     """
     try:
-        with open(CSV_FILENAME, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(CSV_HEADER)
-            for plant_name, data in data_to_save.items():
-                keimdatum_obj = data.get("Keimdatum")
-                if isinstance(keimdatum_obj, datetime):
-                    date_str = keimdatum_obj.strftime('%d.%m.%Y')
-                    writer.writerow([
-                        plant_name,
-                        date_str,
-                        data.get("Genetik", ""),
-                        data.get("Infos", "")
-                    ])
-                else:
-                    print(f"Warnung: Ungültiges oder fehlendes Keimdatum-Objekt für '{plant_name}' beim Speichern. Überspringe.")
+        lines = [",".join(CSV_HEADER)]
+        for plant_name, data in data_to_save.items():
+            keimdatum_obj = data.Keimdatum
+            if isinstance(keimdatum_obj, datetime):
+                date_str = _format_ddmmyyyy(keimdatum_obj)
+                lines.append(
+                    f"{_csv_field(plant_name)},{date_str},"
+                    f"{_csv_field(data.Genetik)},{_csv_field(data.Infos)}"
+                )
+            else:
+                print(f"Warnung: Ungültiges oder fehlendes Keimdatum-Objekt für '{plant_name}' beim Speichern. Überspringe.")
+        # Erst in eine temporäre Datei schreiben und dann atomar ersetzen,
+        # damit ein Absturz beim Schreiben die bestehende CSV-Datei nicht beschädigt.
+        tmp_path = CSV_FILENAME_B + b'.tmp'
+        with open(tmp_path, 'w', newline='', encoding='utf-8') as csvfile:
+            csvfile.write("\n".join(lines) + "\n")
+            csvfile.flush()
+            os.fsync(csvfile.fileno())
+        os.replace(tmp_path, CSV_FILENAME_B)
     except IOError as e:
-         messagebox.showerror("Speicherfehler", f"Fehler beim Schreiben der CSV-Datei '{CSV_FILENAME}':\n{e}")
+         _melden(dialoge, "showerror", "Speicherfehler", f"Fehler beim Schreiben der CSV-Datei '{CSV_FILENAME}':\n{e}")
     except Exception as e:
-         messagebox.showerror("Unerwarteter Speicherfehler", f"Ein Fehler ist beim Speichern der Pflanzendaten aufgetreten:\n{e}")
+         _melden(dialoge, "showerror", "Unerwarteter Speicherfehler", f"Ein Fehler ist beim Speichern der Pflanzendaten aufgetreten:\n{e}")
 
 # --- Phasen und Presets ---
 PHASEN_WOCHEN = {
@@ -116,6 +209,57 @@ BLUETE_PRESET = ["Bio-Bloom", "Top-Max", "Fish-Mix", "CalMag - Correction (Biobi
 
 # --- Düngeberechnungen ---
 
+# Dosierungen pro Liter Wasser (ml/L) - Biobizz Schema
+F_DATA: Dict[str, Dict[int, float]] = {
+    # Biobizz Hauptdünger
+    "Bio-Grow": {1: 2, 2: 2, 3: 2, 4: 2, 5: 3, 6: 4, 7: 4, 8: 4, 9: 4, 10: 4, 11: 0, 12: 0},
+    "Bio-Bloom": {1: 0, 2: 0, 3: 2, 4: 3, 5: 3, 6: 3, 7: 4, 8: 4, 9: 4, 10: 4, 11: 0, 12: 0},
+    "Top-Max": {1: 0, 2: 0, 3: 1, 4: 1, 5: 1, 6: 1, 7: 1, 8: 4, 9: 4, 10: 4, 11: 0, 12: 0},
+    "Bio-Heaven": {1: 2, 2: 2, 3: 2, 4: 2, 5: 3, 6: 4, 7: 4, 8: 5, 9: 5, 10: 5, 11: 0, 12: 0},
+    "Alg-A-Mic": {1: 0, 2: 0, 3: 2, 4: 2, 5: 3, 6: 3, 7: 3, 8: 4, 9: 4, 10: 4, 11: 0, 12: 0},
+    "Acti-Vera": {1: 2, 2: 2, 3: 2, 4: 2, 5: 3, 6: 4, 7: 4, 8: 5, 9: 5, 10: 5, 11: 0, 12: 0},
+    "Root-Juice": {1: 4, 2: 0, 3: 0, 4: 0, 5: 0, 6: 0, 7: 0, 8: 0, 9: 0, 10: 0, 11: 0, 12: 0},
+    # Fish-Mix als Alternative zu Bio-Grow in der Veg-Phase (mit Anpassung für Blüte)
+    "Fish-Mix": {1: 2, 2: 2, 3: 2, 4: 2, 5: 2, 6: 2, 7: 2, 8: 2, 9: 2, 10: 2, 11: 0, 12: 0},
+    # CalMag Schedules
+    "CalMag - Prevention (Biobizz)": {
+        1: 0.3, 2: 0.3, 3: 0.3, 4: 0.3, 5: 0.3, 6: 0.5, 7: 0.5, 8: 0.8, 9: 0.8, 10: 0.8
+    },
+    "CalMag - Correction (Biobizz)": {
+        1: 0.0, 2: 0.18, 3: 0.38, 4: 0.59, 5: 0.74, 6: 0.89, 7: 1.04, 8: 1.2,
+        9: 1.43, 10: 1.66, 11: 1.89, 12: 2.12, 13: 2.35, 14: 2.58, 15: 2.81, 16: 3.04
+    }
+}
+
+# EC-Zielwerte in mS/cm (1 mS/cm = 1000 µS/cm)
+EC_TARGET_VALUES: Dict[int, float] = {
+    1: 0.4, 2: 0.6, 3: 0.7, 4: 0.9, 5: 1.0, 6: 1.2, 7: 1.4, 8: 1.5, 9: 1.6, 10: 1.6,
+    11: 1.7, 12: 1.7, 13: 1.8, 14: 1.8, 15: 1.9, 16: 1.9, 17: 1.9, 18: 2.0, 19: 2.0, 20: 2.0
+}
+EC_MAX_WEEK = max(EC_TARGET_VALUES) if EC_TARGET_VALUES else 1
+
+def _dense_schedule(schedule: Dict[int, float]) -> Tuple[float, ...]:
+    """
+    Wandelt einen Wochenplan {Woche: Wert} in ein Tupel um, das direkt über die
+    Woche indiziert wird (Index 0 bleibt ungenutzt, fehlende Wochen sind 0.0).
+    """
+    get = schedule.get
+    return tuple(float(get(week, 0.0)) for week in range(max(schedule) + 1))
+
+# Dieselben Pläne als dichte, direkt per Woche indizierbare Tupel
+# Schlüssel interniert, damit Lookups mit den ebenfalls internierten GUI-Optionen per Identität treffen
+F_DATA_ARR: Dict[str, Tuple[float, ...]] = {sys.intern(k): _dense_schedule(v) for k, v in F_DATA.items() if v}
+EC_TARGET_VALUES_ARR: Tuple[float, ...] = _dense_schedule(EC_TARGET_VALUES)
+
+# Wochenweise Tabelle über alle Dünger: F_WEEK_ROWS[woche][F_ROW[dünger]].
+# Jeder Dünger ist bereits auf seine letzte definierte Woche begrenzt.
+F_ROW: Dict[str, int] = {name: i for i, name in enumerate(F_DATA_ARR)}
+F_WEEK_MAX = max(len(schedule) - 1 for schedule in F_DATA_ARR.values())
+F_WEEK_ROWS: Tuple[Tuple[float, ...], ...] = tuple(
+    tuple(schedule[min(week, len(schedule) - 1)] for schedule in F_DATA_ARR.values())
+    for week in range(F_WEEK_MAX + 1)
+)
+
 def calculate_fertilizer_amount(week: int, water_amount: float, fertilizer_type: str) -> Optional[float]:
     """
     Berechnet die Düngemenge für eine bestimmte Woche und Wassermenge.
@@ -126,47 +270,29 @@ def calculate_fertilizer_amount(week: int, water_amount: float, fertilizer_type:
         fertilizer_type: Die Art des Düngers (str).
 
     Returns:
-        Die Düngemenge in Millilitern (float) oder None bei ungültigem Typ/Woche.
-    """
-    # Dosierungen pro Liter Wasser (ml/L) - Biobizz Schema
-    fertilizer_data = {
-        # Biobizz Hauptdünger
-        "Bio-Grow": {1: 2, 2: 2, 3: 2, 4: 2, 5: 3, 6: 4, 7: 4, 8: 4, 9: 4, 10: 4, 11: 0, 12: 0},
-        "Bio-Bloom": {1: 0, 2: 0, 3: 2, 4: 3, 5: 3, 6: 3, 7: 4, 8: 4, 9: 4, 10: 4, 11: 0, 12: 0},
-        "Top-Max": {1: 0, 2: 0, 3: 1, 4: 1, 5: 1, 6: 1, 7: 1, 8: 4, 9: 4, 10: 4, 11: 0, 12: 0},
-        "Bio-Heaven": {1: 2, 2: 2, 3: 2, 4: 2, 5: 3, 6: 4, 7: 4, 8: 5, 9: 5, 10: 5, 11: 0, 12: 0},
-        "Alg-A-Mic": {1: 0, 2: 0, 3: 2, 4: 2, 5: 3, 6: 3, 7: 3, 8: 4, 9: 4, 10: 4, 11: 0, 12: 0},
-        "Acti-Vera": {1: 2, 2: 2, 3: 2, 4: 2, 5: 3, 6: 4, 7: 4, 8: 5, 9: 5, 10: 5, 11: 0, 12: 0},
-        "Root-Juice": {1: 4, 2: 0, 3: 0, 4: 0, 5: 0, 6: 0, 7: 0, 8: 0, 9: 0, 10: 0, 11: 0, 12: 0},
-        # Fish-Mix als Alternative zu Bio-Grow in der Veg-Phase (mit Anpassung für Blüte)
-        "Fish-Mix": {1: 2, 2: 2, 3: 2, 4: 2, 5: 2, 6: 2, 7: 2, 8: 2, 9: 2, 10: 2, 11: 0, 12: 0},
-        # CalMag Schedules
-        "CalMag - Prevention (Biobizz)": {
-            1: 0.3, 2: 0.3, 3: 0.3, 4: 0.3, 5: 0.3, 6: 0.5, 7: 0.5, 8: 0.8, 9: 0.8, 10: 0.8
-        },
-        "CalMag - Correction (Biobizz)": {
-            1: 0.0, 2: 0.18, 3: 0.38, 4: 0.59, 5: 0.74, 6: 0.89, 7: 1.04, 8: 1.2,
-            9: 1.43, 10: 1.66, 11: 1.89, 12: 2.12, 13: 2.35, 14: 2.58, 15: 2.81, 16: 3.04
-        }
-    }
-
-    if fertilizer_type not in fertilizer_data:
+        Die Düngemenge in Millilitern (float) oder None bei ungültigem Typ.
+    """
+    schedule = F_DATA_ARR.get(fertilizer_type)
+    if schedule is None:
         print(f"Warnung: Unbekannter Düngertyp '{fertilizer_type}'")
         return None
 
-    # Wähle die maximale definierte Woche, wenn die aktuelle Woche darüber liegt
-    max_defined_week = max(fertilizer_data[fertilizer_type].keys())
-    effective_week = min(week, max_defined_week) if week > 0 else 1 # Mindestens Woche 1 verwenden, falls week <= 0
+    # Wähle die maximale definierte Woche, wenn die aktuelle Woche darüber liegt;
+    # die letzte Woche ergibt sich aus der Tupellänge (Index 0 ist ungenutzt)
+    effective_week = min(max(week, 1), len(schedule) - 1) # Mindestens Woche 1
 
-    dosage_per_liter = fertilizer_data[fertilizer_type].get(effective_week)
+    fertilizer_amount = schedule[effective_week] * water_amount
+    return fertilizer_amount
 
-    if dosage_per_liter is None:
-        # Sollte durch min/max nicht passieren, aber sicherheitshalber
-        print(f"Warnung: Keine Dosierung für Woche {effective_week} bei '{fertilizer_type}' gefunden.")
-        return 0.0 # Oder None? Hier 0.0 um Fehler zu vermeiden
+def calculate_all(week: int, water_amount: float) -> Tuple[float, ...]:
+    """
+    Berechnet die Düngemengen aller Dünger für eine Woche in einem Durchgang.
 
-    fertilizer_amount = dosage_per_liter * water_amount
-    return fertilizer_amount
+    Returns:
+        Die Mengen in Millilitern, in der Reihenfolge von F_ROW.
+    """
+    row = F_WEEK_ROWS[min(max(week, 1), F_WEEK_MAX)] # Mindestens Woche 1
+    return tuple(value * water_amount for value in row)
 
 def get_ec_value(week: int) -> Optional[float]:
     """
@@ -176,38 +302,137 @@ def get_ec_value(week: int) -> Optional[float]:
         week: Die aktuelle Woche seit Keimung (int).
 
     Returns:
-        Den EC-Zielwert für Erde (in mS/cm) oder None, falls die Woche nicht definiert ist.
+        Den EC-Zielwert für Erde (in mS/cm); Wochen über dem Plan liefern den letzten Wert.
     """
-    # EC-Werte in mS/cm (1 mS/cm = 1000 µS/cm)
-    ec_values = {
-        1: 0.4, 2: 0.6, 3: 0.7, 4: 0.9, 5: 1.0, 6: 1.2, 7: 1.4, 8: 1.5, 9: 1.6, 10: 1.6,
-        11: 1.7, 12: 1.7, 13: 1.8, 14: 1.8, 15: 1.9, 16: 1.9, 17: 1.9, 18: 2.0, 19: 2.0, 20: 2.0
-    }
     # Wähle die maximale definierte Woche, wenn die aktuelle Woche darüber liegt
-    max_defined_week = max(ec_values.keys())
-    effective_week = min(week, max_defined_week) if week > 0 else 1 # Mindestens Woche 1
-    return ec_values.get(effective_week)
+    effective_week = min(max(week, 1), EC_MAX_WEEK) # Mindestens Woche 1
+    return EC_TARGET_VALUES_ARR[effective_week]
+
+def _ec_to_ml(ec_ist: float, ec_soll: float, liters: float, factor: float) -> float:
+    """
+    Berechnet die Düngermenge in ml, um von ec_ist auf ec_soll zu kommen.
+    factor ist die EC-Zunahme in µS/cm pro ml/L des jeweiligen Düngers.
+    """
+    diff = ec_soll - ec_ist
+    # Menge in ml = (Gewünschte EC-Änderung / EC-Änderung pro ml/L) * Liter
+    return (diff / factor) * liters if diff > 0 else 0.0
 
 def berechne_wachstumduenger_menge_fuer_ec(EC_ist: float, EC_soll: float, wassermenge_liter: float) -> float:
     """Berechnet die benötigte Menge Wachstumsdünger in ml."""
-    if EC_ist >= EC_soll:
-        return 0.0
-    benötigte_ec_zunahme = EC_soll - EC_ist
-    # Menge in ml = (Gewünschte EC-Änderung / EC-Änderung pro ml/L) * Liter
-    benötigte_menge_ml = (benötigte_ec_zunahme / EC_FACTOR_WACHSTUM) * wassermenge_liter
-    return max(0.0, benötigte_menge_ml) # Sicherstellen, dass nicht negativ
+    return _ec_to_ml(EC_ist, EC_soll, wassermenge_liter, EC_FACTOR_WACHSTUM)
 
 def berechne_bluetenduenger_menge_fuer_ec(EC_ist: float, EC_soll: float, wassermenge_liter: float) -> float:
     """Berechnet die benötigte Menge Blütendünger in ml."""
-    if EC_ist >= EC_soll:
-        return 0.0
-    benötigte_ec_zunahme = EC_soll - EC_ist
-    # Menge in ml = (Gewünschte EC-Änderung / EC-Änderung pro ml/L) * Liter
-    benötigte_menge_ml = (benötigte_ec_zunahme / EC_FACTOR_BLUETE) * wassermenge_liter
-    return max(0.0, benötigte_menge_ml) # Sicherstellen, dass nicht negativ
+    return _ec_to_ml(EC_ist, EC_soll, wassermenge_liter, EC_FACTOR_BLUETE)
 
 # --- GUI Callbacks und Hilfsfunktionen ---
 
+def _today() -> datetime:
+    """Gibt das heutige Datum als datetime um 00:00 Uhr zurück."""
+    return datetime.combine(date.today(), time())
+
+_pending_calc: Optional[str] = None # after()-ID der eingeplanten Neuberechnung
+_pending_plant: Optional[str] = None # after()-ID der eingeplanten Pflanzenanzeige
+_plant_keys_cache: List[str] = [] # Pflanzennamen in Dropdown-Reihenfolge, wird inkrementell gepflegt
+# Pflanzennamen in casefold-Form -> Anzahl, für die Duplikatprüfung ohne Groß-/Kleinschreibung.
+# Gezählt, weil ältere CSV-Dateien z.B. "Tomate" und "tomate" gleichzeitig enthalten können.
+_names_ci: Dict[str, int] = {}
+_plan_ec_us: Optional[float] = None # Aktuell angezeigter EC-Zielwert in µS/cm (None = keiner)
+_io_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1) # Ein Worker: Schreibreihenfolge bleibt erhalten
+_csv_dirty: bool = False # Ungespeicherte Änderungen an plant_data
+_ungespeicherte_aenderungen: int = 0
+_pending_save: Optional[str] = None # after()-ID des eingeplanten Speicherns
+_offene_speichervorgaenge: List[concurrent.futures.Future] = [] # Noch nicht ausgewertete Schreibvorgänge
+
+def _aenderung_vormerken() -> None:
+    """
+    Merkt eine Änderung an plant_data vor. Alle Änderungen innerhalb von
+    SPEICHER_VERZOEGERUNG_MS werden gemeinsam geschrieben, spätestens aber nach
+    SPEICHER_INTERVALL Änderungen oder beim Schließen des Fensters.
+    """
+    global _csv_dirty, _ungespeicherte_aenderungen, _pending_save
+    _csv_dirty = True
+    _ungespeicherte_aenderungen += 1
+    if _ungespeicherte_aenderungen >= SPEICHER_INTERVALL:
+        aenderungen_schreiben()
+    elif _pending_save is None:
+        _pending_save = window.after(SPEICHER_VERZOEGERUNG_MS, aenderungen_schreiben)
+
+def _save_snapshot(snapshot: Dict[str, PlantRecord]) -> List[Tuple[str, str, str]]:
+    """Schreibt eine Kopie der Pflanzendaten im Hintergrund und liefert gesammelte Fehlerdialoge."""
+    dialoge: List[Tuple[str, str, str]] = []
+    save_plant_data_to_csv(snapshot, dialoge)
+    return dialoge
+
+def _zeige_dialoge(dialoge: List[Tuple[str, str, str]]) -> None:
+    """Zeigt im GUI-Thread die von einem Hintergrund-Thread gesammelten Dialoge an."""
+    for art, titel, text in dialoge:
+        getattr(messagebox, art)(titel, text)
+
+def _speichern_pruefen(future: concurrent.futures.Future) -> None:
+    """
+    Wartet per after() auf das Ende eines Hintergrund-Speichervorgangs.
+    Ist das Schreiben fehlgeschlagen, bleiben die Änderungen als ungespeichert markiert,
+    damit das nächste Speichern bzw. das Schließen des Fensters es erneut versucht.
+    """
+    global _csv_dirty
+    if not future.done():
+        window.after(PLANT_LOAD_POLL_MS, _speichern_pruefen, future)
+        return
+    if future not in _offene_speichervorgaenge:
+        return # Bereits von fenster_schliessen ausgewertet
+    _offene_speichervorgaenge.remove(future)
+    dialoge = future.result()
+    if dialoge:
+        _csv_dirty = True
+    _zeige_dialoge(dialoge)
+
+def aenderungen_schreiben() -> Optional[concurrent.futures.Future]:
+    """
+    Schreibt ausstehende Änderungen im Hintergrund in die CSV-Datei.
+    Gibt den laufenden Speichervorgang zurück, falls einer gestartet wurde.
+    """
+    global _csv_dirty, _ungespeicherte_aenderungen, _pending_save
+    if _pending_save is not None:
+        window.after_cancel(_pending_save)
+        _pending_save = None
+    if not _csv_dirty:
+        return None
+    # Kopie der einzelnen Einträge, damit spätere Änderungen den Schreibvorgang nicht stören
+    snapshot = {name: replace(daten) for name, daten in plant_data.items()}
+    future = _io_executor.submit(_save_snapshot, snapshot)
+    _csv_dirty = False
+    _ungespeicherte_aenderungen = 0
+    _offene_speichervorgaenge.append(future)
+    window.after(PLANT_LOAD_POLL_MS, _speichern_pruefen, future)
+    return future
+
+def _beim_beenden_speichern() -> None:
+    """
+    Letzte Absicherung per atexit, falls das Programm ohne fenster_schliessen endet.
+    Schreibt synchron, da Tk und der Hintergrund-Worker dann nicht mehr verfügbar sind.
+    """
+    if _csv_dirty:
+        dialoge: List[Tuple[str, str, str]] = []
+        save_plant_data_to_csv(plant_data, dialoge)
+        for _art, titel, text in dialoge:
+            print(f"{titel}: {text}")
+
+def fenster_schliessen() -> None:
+    """Schreibt ausstehende Änderungen und schließt das Hauptfenster."""
+    global _csv_dirty
+    aenderungen_schreiben()
+    _io_executor.shutdown(wait=True) # Laufende Schreibvorgänge abschließen
+    # Noch nicht ausgewertete Schreibvorgänge prüfen, da after() nach destroy() nicht mehr läuft
+    offene = _offene_speichervorgaenge[:]
+    _offene_speichervorgaenge.clear()
+    for future in offene:
+        dialoge = future.result()
+        if dialoge:
+            _csv_dirty = True # _beim_beenden_speichern versucht es noch einmal
+        _zeige_dialoge(dialoge)
+    window.destroy()
+
 def apply_preset(event=None):
     """Stellt die Checkboxen basierend auf der ausgewählten Phase ein."""
     selected_phase = phase_var.get()
@@ -228,54 +453,57 @@ def apply_preset(event=None):
     calculate()
 
 
+def _set_readonly(widget: ttk.Entry, value: str) -> None:
+    """Ersetzt den Inhalt eines schreibgeschützten Eingabefelds."""
+    widget.config(state="normal")
+    widget.delete(0, tk.END)
+    widget.insert(0, value)
+    widget.config(state="readonly")
+
 def update_week(event=None):
     """
     Aktualisiert die GUI-Felder basierend auf der ausgewählten Pflanze.
     Setzt die Standardwerte für die manuelle Berechnung.
+    Eine erneute Auswahl derselben Pflanze im Dropdown wird am selben Tag ignoriert,
+    solange Phase, Woche und Dünger nicht von Hand geändert wurden.
     """
     try:
         selected_plant = plant_var.get()
-        if not selected_plant or selected_plant not in plant_data:
+        if event is not None and (selected_plant, _today()) == update_week._last:
+            return # Auswahl und Datum unverändert, Anzeige ist aktuell
+
+        plant_info = plant_data.get(selected_plant)
+        if plant_info is None:
             # Leere alle Felder, wenn keine Pflanze ausgewählt ist
+            update_week._last = None
             auto_week_label.config(text="-")
             phase_var.set("")
             calc_week_var.set(0)
-            germination_date_entry.config(state="normal")
-            germination_date_entry.delete(0, tk.END)
-            germination_date_entry.config(state="readonly")
-            genetics_entry.config(state="normal")
-            genetics_entry.delete(0, tk.END)
-            genetics_entry.config(state="readonly")
+            _set_readonly(germination_date_entry, "")
+            _set_readonly(genetics_entry, "")
             info_text.config(state="normal")
             info_text.delete("1.0", tk.END)
             info_text.config(state="disabled")
-            ec_label.config(text="EC-Ziel (Erde): -")
-            for label in result_labels:
-                label.config(text="")
+            _info_unveraendert()
+            _update_ec_label(0)
+            _clear_results()
             save_button.config(state="disabled")
             return
 
         # Pflanze ausgewählt -> Felder füllen
-        plant_info = plant_data[selected_plant]
-        germination_date = plant_info["Keimdatum"]
-        today = datetime.today()
-
-        delta_days = (today - germination_date).days
-        current_week = max(1, (delta_days // 7 + 1))
+        today = _today()
+        update_week._last = (selected_plant, today)
+        germination_date = plant_info.Keimdatum
+        current_week = max(1, (today.toordinal() - plant_info.germ_ord) // 7 + 1)
 
         # Info-Felder aktualisieren
         auto_week_label.config(text=str(current_week))
-        germination_date_entry.config(state="normal")
-        germination_date_entry.delete(0, tk.END)
-        germination_date_entry.insert(0, germination_date.strftime('%d.%m.%Y'))
-        germination_date_entry.config(state="readonly")
-        genetics_entry.config(state="normal")
-        genetics_entry.delete(0, tk.END)
-        genetics_entry.insert(0, plant_info["Genetik"])
-        genetics_entry.config(state="readonly")
+        _set_readonly(germination_date_entry, _format_ddmmyyyy(germination_date))
+        _set_readonly(genetics_entry, plant_info.Genetik)
         info_text.config(state="normal")
         info_text.delete("1.0", tk.END)
-        info_text.insert("1.0", plant_info["Infos"])
+        info_text.insert("1.0", plant_info.Infos)
+        _info_unveraendert()
         save_button.config(state="normal")
 
         # Standardwerte für manuelle Berechnung setzen
@@ -285,96 +513,208 @@ def update_week(event=None):
         phase_var.set(current_phase)
         calc_week_var.set(current_week)
 
-        # Preset anwenden und Neuberechnung anstoßen
+        # Preset anwenden; stößt die gemeinsame Neuberechnung (EC + Dünger) an
         apply_preset()
-        update_ec_value()
 
     except Exception as e:
          messagebox.showerror("Fehler beim Aktualisieren", f"Ein unerwarteter Fehler ist in update_week aufgetreten:\n{e}")
 
+update_week._last = None # (Pflanze, Tag) der zuletzt angezeigten Werte
+
+def _manuell_geaendert() -> None:
+    """
+    Vergisst die zuletzt angezeigte Pflanze, nachdem Phase, Woche oder Dünger von Hand
+    geändert wurden; eine erneute Auswahl setzt die Werte dann wieder auf die Pflanze zurück.
+    """
+    update_week._last = None
+
+def _phase_gewaehlt(event=None):
+    """Manuelle Phasenauswahl: Preset anwenden."""
+    _manuell_geaendert()
+    apply_preset(event)
+
+def _woche_gewaehlt(event=None):
+    """Manuelle Wochenauswahl: neu berechnen."""
+    _manuell_geaendert()
+    calculate(event)
+
+def _duenger_umgeschaltet():
+    """Manuelles An-/Abwählen eines Düngers: neu berechnen."""
+    _manuell_geaendert()
+    calculate()
+
+def _pflanze_gewaehlt(event=None):
+    """
+    Plant update_week nach einer Auswahl im Pflanzen-Dropdown ein.
+    Schnell aufeinanderfolgende Auswahlen (z.B. per Mausrad) füllen die Felder nur einmal.
+    """
+    global _pending_plant
+    if _pending_plant is not None:
+        window.after_cancel(_pending_plant)
+    _pending_plant = window.after(CALC_DEBOUNCE_MS, _pflanze_anzeigen, event)
+
+def _pflanze_anzeigen(event):
+    """Führt die eingeplante Aktualisierung für die zuletzt gewählte Pflanze aus."""
+    global _pending_plant
+    _pending_plant = None
+    update_week(event)
+
+def _clear_results() -> None:
+    """Leert alle Ergebnis-Labels; bereits leere Labels werden nicht erneut geschrieben."""
+    for result_label in result_labels:
+        if result_label.cget("text"):
+            result_label.config(text="")
 
 def calculate(event=None):
+    """
+    Plant die Neuberechnung von EC-Zielwert und Düngermengen ein.
+    Mehrere Auslöser innerhalb von CALC_DEBOUNCE_MS ergeben nur eine Berechnung.
+    """
+    global _pending_calc
+    if _pending_calc is not None:
+        window.after_cancel(_pending_calc)
+    _pending_calc = window.after(CALC_DEBOUNCE_MS, _recompute_all)
+
+def _berechnungswoche() -> Optional[int]:
+    """Liest die Berechnungswoche aus; None, wenn sie noch nicht gesetzt oder leer ist."""
+    try:
+        return calc_week_var.get()
+    except (tk.TclError, ValueError):
+        return None
+
+def _calculate_on_return(event=None):
+    """
+    Neuberechnung per Enter in der Wassermenge. Zeigen die Labels bereits das Ergebnis
+    für diese Wassermenge und Woche, wird nicht erneut gerechnet.
+    """
+    if (water_amount_entry.get(), _berechnungswoche()) == _recompute_all._last_key:
+        return
+    calculate()
+
+def _recompute_all():
+    """
+    Liest die Berechnungswoche einmal aus und aktualisiert damit das EC-Label
+    und alle Dünger-Labels in einem Durchgang.
+    """
+    global _pending_calc
+    _pending_calc = None
+    week = _berechnungswoche()
+    _update_ec_label(week)
+    water_amount_str = water_amount_entry.get()
+    ok = _update_fertilizer_labels(week)
+    # Nur fehlerfreie Berechnungen merken, damit Enter Fehler erneut anzeigen kann
+    _recompute_all._last_key = (water_amount_str, week) if ok else None
+
+_recompute_all._last_key = None # (Wassermenge, Woche) der angezeigten Ergebnisse
+
+def _update_ec_label(week: Optional[int]) -> None:
+    """
+    Berechnet und aktualisiert das EC-Zielwert-Label in der GUI.
+    Der Zahlenwert wird zusätzlich in _plan_ec_us für den EC-Helper abgelegt.
+    """
+    global _plan_ec_us
+    _plan_ec_us = None
+    try:
+        ec_value_ms = get_ec_value(week) if week else None # 0: keine Pflanze ausgewählt
+        if ec_value_ms is not None:
+            _plan_ec_us = ec_value_ms * 1000
+            ec_label.config(text=f"EC-Ziel (Erde): {_plan_ec_us:.0f} µS/cm")
+        else:
+            ec_label.config(text="EC-Ziel (Erde): -")
+    except Exception as e:
+        _plan_ec_us = None
+        ec_label.config(text="EC-Ziel (Erde): Fehler")
+        print(f"Fehler in _update_ec_label: {e}")
+
+def _update_fertilizer_labels(week: Optional[int]) -> bool:
     """
     Berechnet die Düngermenge für ausgewählte Dünger und aktualisiert die Labels.
     Wird durch Checkbox-Änderungen oder manuelle Auswahl ausgelöst.
+    Gibt False zurück, wenn die Eingaben ungültig waren oder die Berechnung fehlschlug.
     """
+    if week is None or not any(f_var.get() for f_var in fertilizer_vars):
+        # Keine gültige Woche oder nichts angehakt: nur noch vorhandene Ergebnisse entfernen
+        _clear_results()
+        return True
+    if week == 0: # Passiert, wenn keine Pflanze ausgewählt ist
+        return True
     try:
-        # Hole die Berechnungswoche aus dem neuen Dropdown-Menü
-        try:
-            week = calc_week_var.get()
-            if week == 0: # Passiert, wenn keine Pflanze ausgewählt ist
-                return
-        except (tk.TclError, ValueError):
-            # Variable ist noch nicht gesetzt oder leer
-            for result_label in result_labels:
-                result_label.config(text="")
-            return
-
         water_amount_str = water_amount_entry.get()
         water_amount = float(water_amount_str) if water_amount_str else 0.0
 
         if water_amount <= 0:
-            for result_label in result_labels:
-                 result_label.config(text="")
-            return
-
-        # Berechne alle Dünger, die angehakt sind
-        for i, (f_var, result_label) in enumerate(zip(fertilizer_vars, result_labels)):
-            current_fertilizer_type = fertilizer_options[i]
+            _clear_results()
+            return True
 
+        # Alle Mengen der Woche auf einmal berechnen, angehakte Dünger anzeigen
+        amounts = calculate_all(week, water_amount)
+        for current_fertilizer_type, f_var, result_label in FERTILIZER_TRIPLES:
             if f_var.get() == 1:
-                result = calculate_fertilizer_amount(week, water_amount, current_fertilizer_type)
+                row = F_ROW.get(current_fertilizer_type)
+                result = amounts[row] if row is not None else None
                 if result is not None:
                     result_label.config(text=f"{result:.2f} ml")
                 else:
                      result_label.config(text="Fehler")
-            else:
+            elif result_label.cget("text"):
                 result_label.config(text="")
+        return True
 
     except ValueError:
-        for result_label in result_labels:
-             result_label.config(text="")
+        _clear_results()
     except Exception as e:
         messagebox.showerror("Berechnungsfehler", f"Ein Fehler ist bei der Berechnung aufgetreten:\n{e}")
+    return False
 
 
-def update_ec_value(event=None):
-    """Berechnet und aktualisiert das EC-Zielwert-Label in der GUI."""
-    try:
-        week = calc_week_var.get()
-        if week == 0:
-            ec_label.config(text="EC-Ziel (Erde): -")
-            return
-
-        ec_value_ms = get_ec_value(week)
-
-        if ec_value_ms is not None:
-            ec_value_us = ec_value_ms * 1000
-            ec_label.config(text=f"EC-Ziel (Erde): {ec_value_us:.0f} µS/cm")
-        else:
-            ec_label.config(text="EC-Ziel (Erde): -")
-    except (tk.TclError, ValueError):
-        ec_label.config(text="EC-Ziel (Erde): -")
-    except Exception as e:
-        ec_label.config(text="EC-Ziel (Erde): Fehler")
-        print(f"Fehler in update_ec_value: {e}")
-
-
-def save_info():
-    """Speichert die geänderten Infos für die aktuelle Pflanze."""
+def _ausgewaehlte_pflanze(zweck: str) -> Optional[str]:
+    """
+    Gibt den Namen der im Dropdown ausgewählten Pflanze zurück.
+    Ist keine (bekannte) Pflanze ausgewählt, wird eine Warnung angezeigt und None geliefert;
+    zweck ergänzt den Hinweistext (z.B. "um Infos zu speichern").
+    """
     selected_plant = plant_var.get()
     if not selected_plant or selected_plant not in plant_data:
-         messagebox.showwarning("Keine Pflanze ausgewählt", "Bitte zuerst eine Pflanze auswählen, um Infos zu speichern.")
+        messagebox.showwarning("Keine Pflanze ausgewählt", f"Bitte zuerst eine Pflanze auswählen, {zweck}.")
+        return None
+    return selected_plant
+
+def save_info():
+    """
+    Übernimmt die geänderten Infos für die aktuelle Pflanze.
+    Geschrieben wird gesammelt über _aenderung_vormerken.
+    """
+    selected_plant = _ausgewaehlte_pflanze("um Infos zu speichern")
+    if selected_plant is None:
          return
 
+    if not save_info._dirty:
+        return # Seit dem Laden nicht bearbeitet, Text muss nicht gelesen werden
+
     try:
         new_info = info_text.get("1.0", tk.END).strip()
-        plant_data[selected_plant]["Infos"] = new_info
-        save_plant_data_to_csv(plant_data)
-        messagebox.showinfo("Gespeichert", f"Infos für '{selected_plant}' wurden gespeichert.")
+        save_info._dirty = False
+        if plant_data[selected_plant].Infos == new_info:
+            return # Nichts geändert
+        plant_data[selected_plant].Infos = new_info
+        _aenderung_vormerken()
+        messagebox.showinfo("Übernommen", f"Infos für '{selected_plant}' wurden übernommen.")
     except Exception as e:
         messagebox.showerror("Fehler beim Speichern", f"Konnte Infos nicht speichern:\n{e}")
 
+save_info._dirty = False # Wird über <<Modified>> von info_text gesetzt
+
+def _info_modified(event=None):
+    """Merkt Bearbeitungen im Infofeld vor und setzt das Tk-Modified-Flag zurück."""
+    if info_text.edit_modified():
+        save_info._dirty = True
+        info_text.edit_modified(False)
+
+def _info_unveraendert():
+    """Markiert den programmatisch gesetzten Inhalt des Infofelds als unverändert."""
+    info_text.edit_modified(False)
+    save_info._dirty = False
+
 def neue_pflanze_hinzufuegen():
     """Öffnet ein modales Fenster zur Eingabe einer neuen Pflanze."""
 
@@ -388,18 +728,21 @@ def neue_pflanze_hinzufuegen():
         errors = []
         if not neuer_pflanzenname:
             errors.append("Pflanzenname fehlt.")
-        elif neuer_pflanzenname in plant_data:
+        elif neuer_pflanzenname.casefold() in _names_ci:
             errors.append(f"Pflanzenname '{neuer_pflanzenname}' existiert bereits.")
 
+        keimdatum_objekt: Optional[datetime] = None
         if not neues_keimdatum_str:
             errors.append("Keimdatum fehlt.")
         else:
             try:
-                keimdatum_objekt = datetime.strptime(neues_keimdatum_str, '%d.%m.%Y')
-                if keimdatum_objekt > datetime.now():
-                    errors.append("Keimdatum darf nicht in der Zukunft liegen.")
-            except ValueError:
+                keimdatum_objekt = _parse_ddmmyyyy(neues_keimdatum_str)
+            except ValueError: # Format passt, aber Datum existiert nicht (z.B. 31.02.)
+                keimdatum_objekt = None
+            if keimdatum_objekt is None:
                 errors.append("Ungültiges Keimdatum (Format TT.MM.JJJJ).")
+            elif keimdatum_objekt > _today(): # Nur das Kalenderdatum zählt
+                errors.append("Keimdatum darf nicht in der Zukunft liegen.")
 
         if not neue_genetik:
             errors.append("Genetik fehlt.")
@@ -409,16 +752,13 @@ def neue_pflanze_hinzufuegen():
             return
 
         try:
-            keimdatum_objekt = datetime.strptime(neues_keimdatum_str, '%d.%m.%Y')
-            plant_data[neuer_pflanzenname] = {
-                "Keimdatum": keimdatum_objekt,
-                "Genetik": neue_genetik,
-                "Infos": neue_infos
-            }
-            save_plant_data_to_csv(plant_data)
-
-            plant_keys = list(plant_data.keys())
-            plant_dropdown['values'] = plant_keys
+            # Bei der Validierung bereits geparst, kein zweites Parsen nötig
+            plant_data[neuer_pflanzenname] = PlantRecord(keimdatum_objekt, neue_genetik, neue_infos)
+            _aenderung_vormerken()
+
+            _plant_keys_cache.append(neuer_pflanzenname)
+            _names_ci[neuer_pflanzenname.casefold()] = 1
+            plant_dropdown['values'] = tuple(_plant_keys_cache)
             plant_var.set(neuer_pflanzenname)
             update_week()
 
@@ -469,20 +809,27 @@ def neue_pflanze_hinzufuegen():
 
 def pflanze_loeschen():
     """Löscht die ausgewählte Pflanze nach Bestätigung."""
-    selected_plant = plant_var.get()
-    if not selected_plant or selected_plant not in plant_data:
-        messagebox.showwarning("Keine Pflanze ausgewählt", "Bitte zuerst eine Pflanze zum Löschen auswählen.")
+    selected_plant = _ausgewaehlte_pflanze("um sie zu löschen")
+    if selected_plant is None:
         return
 
     if messagebox.askyesno("Pflanze löschen", f"Möchten Sie die Pflanze '{selected_plant}' wirklich unwiderruflich löschen?"):
         try:
-            del plant_data[selected_plant]
-            save_plant_data_to_csv(plant_data)
+            # Prüfen und Entfernen in einem Schritt (die Pflanze kann seit der Abfrage entfernt worden sein)
+            if plant_data.pop(selected_plant, None) is None:
+                messagebox.showwarning("Keine Pflanze ausgewählt", "Bitte zuerst eine Pflanze auswählen, um sie zu löschen.")
+                return
+            _aenderung_vormerken()
 
-            plant_keys = list(plant_data.keys())
-            plant_dropdown['values'] = plant_keys
-            if plant_keys:
-                plant_var.set(plant_keys[0])
+            _plant_keys_cache.remove(selected_plant)
+            name_ci = selected_plant.casefold()
+            if _names_ci.get(name_ci, 0) > 1:
+                _names_ci[name_ci] -= 1
+            else:
+                _names_ci.pop(name_ci, None)
+            plant_dropdown['values'] = tuple(_plant_keys_cache)
+            if _plant_keys_cache:
+                plant_var.set(_plant_keys_cache[0])
             else:
                 plant_var.set("")
 
@@ -520,11 +867,9 @@ def ec_berechnen():
                  raise ValueError("Wassermenge muss positiv sein.")
 
             if ec_soll_var.get() == "vorhanden":
-                ec_soll_text = ec_label.cget("text")
-                if ":" not in ec_soll_text or "µS/cm" not in ec_soll_text:
+                if _plan_ec_us is None:
                      raise ValueError("Ziel-EC-Wert im Hauptfenster nicht verfügbar oder ungültig.")
-                ec_soll_str = ec_soll_text.split(":")[1].strip().split()[0]
-                ec_soll = float(ec_soll_str)
+                ec_soll = float(round(_plan_ec_us)) # Wie im Label angezeigt gerundet
             else: # manuell
                 ec_soll_str = ec_soll_entry.get()
                 if not ec_soll_str:
@@ -588,12 +933,43 @@ def ec_berechnen():
     ec_window.wait_window()
 
 
+def _load_plant_data_worker(result_queue: queue.Queue) -> None:
+    """Liest die Pflanzendaten im Hintergrund; Dialoge werden für den GUI-Thread gesammelt."""
+    dialoge: List[Tuple[str, str, str]] = []
+    data = read_plant_data(dialoge)
+    result_queue.put((data, dialoge))
+
+def _populate_when_ready() -> None:
+    """Übernimmt die im Hintergrund geladenen Pflanzendaten, sobald sie vorliegen."""
+    try:
+        geladen, dialoge = _plant_data_queue.get_nowait()
+    except queue.Empty:
+        window.after(PLANT_LOAD_POLL_MS, _populate_when_ready)
+        return
+    _zeige_dialoge(dialoge)
+    plant_data.update(geladen)
+    _plant_keys_cache[:] = plant_data
+    for name in plant_data:
+        name_ci = name.casefold()
+        _names_ci[name_ci] = _names_ci.get(name_ci, 0) + 1
+    plant_dropdown['values'] = tuple(_plant_keys_cache)
+    if _plant_keys_cache:
+        plant_var.set(_plant_keys_cache[0])
+    update_week()
+    # Erst jetzt Änderungen erlauben, sonst würde die CSV mit unvollständigen Daten überschrieben
+    neue_pflanze_button.config(state="normal")
+    loeschen_button.config(state="normal")
+
+
 # --- Haupt-GUI Erstellung ---
 window = tk.Tk()
 window.title("Pflanzen Düngerberechnung v1.2") # Version erhöht
 window.minsize(550, 600)
 
 style = ttk.Style()
+# Schriftvarianten einmal als Stil festlegen statt pro Widget
+style.configure("EC.TLabel", font=('TkDefaultFont', 9, 'bold'))
+style.configure("Hinweis.TLabel", font=('TkDefaultFont', 7))
 window.columnconfigure(1, weight=1)
 
 # --- Widgets ---
@@ -606,9 +982,9 @@ ttk.Label(plant_info_frame, text="Pflanze:").grid(row=0, column=0, padx=5, pady=
 plant_var = tk.StringVar()
 plant_dropdown = ttk.Combobox(plant_info_frame, textvariable=plant_var, state="readonly")
 plant_dropdown.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
-plant_dropdown.bind("<<ComboboxSelected>>", update_week)
+plant_dropdown.bind("<<ComboboxSelected>>", _pflanze_gewaehlt)
 
-ec_label = ttk.Label(plant_info_frame, text="EC-Ziel (Erde): -", font=('TkDefaultFont', 9, 'bold'))
+ec_label = ttk.Label(plant_info_frame, text="EC-Ziel (Erde): -", style="EC.TLabel")
 ec_label.grid(row=0, column=2, padx=10, pady=5, sticky="e")
 
 ttk.Label(plant_info_frame, text="Genetik:").grid(row=1, column=0, padx=5, pady=5, sticky="w")
@@ -632,15 +1008,15 @@ manual_calc_frame.columnconfigure(3, weight=1)
 
 ttk.Label(manual_calc_frame, text="Phase:").grid(row=0, column=0, padx=5, pady=5, sticky="w")
 phase_var = tk.StringVar()
-phase_dropdown = ttk.Combobox(manual_calc_frame, textvariable=phase_var, values=list(PHASEN_WOCHEN.keys()), state="readonly")
+phase_dropdown = ttk.Combobox(manual_calc_frame, textvariable=phase_var, values=tuple(PHASEN_WOCHEN), state="readonly")
 phase_dropdown.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
-phase_dropdown.bind("<<ComboboxSelected>>", apply_preset)
+phase_dropdown.bind("<<ComboboxSelected>>", _phase_gewaehlt)
 
 ttk.Label(manual_calc_frame, text="Woche für Berechnung:").grid(row=0, column=2, padx=5, pady=5, sticky="w")
 calc_week_var = tk.IntVar()
-calc_week_dropdown = ttk.Combobox(manual_calc_frame, textvariable=calc_week_var, values=list(range(1, 17)), state="readonly")
+calc_week_dropdown = ttk.Combobox(manual_calc_frame, textvariable=calc_week_var, values=tuple(range(1, 17)), state="readonly")
 calc_week_dropdown.grid(row=0, column=3, padx=5, pady=5, sticky="ew")
-calc_week_dropdown.bind("<<ComboboxSelected>>", lambda event: [calculate(), update_ec_value()])
+calc_week_dropdown.bind("<<ComboboxSelected>>", _woche_gewaehlt)
 
 
 # Frame für Berechnungs-Inputs
@@ -652,7 +1028,7 @@ ttk.Label(calc_input_frame, text="Wassermenge (Liter):").grid(row=0, column=0, p
 water_amount_entry = ttk.Entry(calc_input_frame, width=10)
 water_amount_entry.grid(row=0, column=1, padx=5, pady=5, sticky="w")
 water_amount_entry.insert(0, "1.0")
-water_amount_entry.bind("<Return>", lambda event: calculate())
+water_amount_entry.bind("<Return>", _calculate_on_return)
 
 ec_button = ttk.Button(calc_input_frame, text="EC-Helper", command=ec_berechnen)
 ec_button.grid(row=0, column=2, padx=10, pady=5, sticky="e")
@@ -664,10 +1040,10 @@ fertilizer_frame.columnconfigure(0, weight=1)
 fertilizer_frame.columnconfigure(1, minsize=80)
 window.rowconfigure(3, weight=1)
 
-fertilizer_options = [
+fertilizer_options = [sys.intern(option) for option in (
     "Bio-Grow", "Bio-Bloom", "Top-Max", "Bio-Heaven", "Alg-A-Mic", "Acti-Vera",
     "Root-Juice", "Fish-Mix", "CalMag - Prevention (Biobizz)", "CalMag - Correction (Biobizz)"
-]
+)]
 fertilizer_vars = []
 checkboxes = []
 result_labels = []
@@ -680,21 +1056,22 @@ for i, option in enumerate(fertilizer_options):
     row_frame = ttk.Frame(fertilizer_frame)
     row_frame.grid(row=i, column=0, sticky='w')
 
-    # Binde den Befehl mit Lambda, um die aktuellen Werte zu übergeben
-    cmd = lambda: calculate()
-
-    checkbox = ttk.Checkbutton(row_frame, text=option, variable=var, command=cmd)
+    # calculate() liest alle Checkboxen selbst aus, daher ohne eigenen Closure je Checkbox
+    checkbox = ttk.Checkbutton(row_frame, text=option, variable=var, command=_duenger_umgeschaltet)
     checkbox.pack(side=tk.LEFT, padx=(5,0))
     checkboxes.append(checkbox)
 
     if option == "Fish-Mix":
-        info_label = ttk.Label(row_frame, text="(abweichend vom Schema)", font=('TkDefaultFont', 7))
+        info_label = ttk.Label(row_frame, text="(abweichend vom Schema)", style="Hinweis.TLabel")
         info_label.pack(side=tk.LEFT, padx=5, anchor='w')
 
     result_label = ttk.Label(fertilizer_frame, text="", width=10, anchor="e")
     result_label.grid(row=i, column=1, padx=5, pady=2, sticky="e")
     result_labels.append(result_label)
 
+# Feste Zuordnung (Dünger, Variable, Ergebnis-Label) für die Berechnungsschleife
+FERTILIZER_TRIPLES: Tuple[Tuple[str, tk.IntVar, ttk.Label], ...] = tuple(zip(fertilizer_options, fertilizer_vars, result_labels))
+
 # Frame für Infos
 info_frame = ttk.LabelFrame(window, text="Notizen zur Pflanze")
 info_frame.grid(row=4, column=0, columnspan=3, padx=10, pady=5, sticky="ew")
@@ -702,6 +1079,7 @@ info_frame.columnconfigure(0, weight=1)
 
 info_text = scrolledtext.ScrolledText(info_frame, height=6, width=50, wrap=tk.WORD, state="disabled")
 info_text.grid(row=0, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+info_text.bind("<<Modified>>", _info_modified)
 
 save_button = ttk.Button(info_frame, text="Infos speichern", command=save_info, state="disabled")
 save_button.grid(row=1, column=1, padx=5, pady=5, sticky="e")
@@ -717,12 +1095,13 @@ loeschen_button.pack(side=tk.LEFT, padx=5)
 
 
 # --- Initialisierung ---
-plant_data = read_plant_data()
-plant_dropdown['values'] = list(plant_data.keys())
-if plant_data:
-    plant_var.set(list(plant_data.keys())[0])
-    update_week()
-else:
-    update_week()
+plant_data: Dict[str, PlantRecord] = {}
+neue_pflanze_button.config(state="disabled")
+loeschen_button.config(state="disabled")
+_plant_data_queue: queue.Queue = queue.Queue()
+threading.Thread(target=_load_plant_data_worker, args=(_plant_data_queue,), daemon=True).start()
+window.protocol("WM_DELETE_WINDOW", fenster_schliessen)
+atexit.register(_beim_beenden_speichern)
+window.after(PLANT_LOAD_POLL_MS, _populate_when_ready)
 
 window.mainloop()
\ No newline at end of file